@@ -28,14 +28,12 @@ ObservationPtr StatContext::get(const std::string& name) const {
 }
 
 void StatContext::add(const ObservationPtr& obs) {
-    std::map<std::string, ObservationPtr>::iterator existing = stats_.find(obs->getName());
-    if (existing == stats_.end()) {
-        stats_.insert(make_pair(obs->getName() ,obs));
-    } else {
+    // insert() does not overwrite existing entries and reports whether
+    // the element was added, so there is no need for a separate find().
+    if (!stats_.insert(make_pair(obs->getName(), obs)).second) {
         isc_throw(DuplicateStat, "Statistic named " << obs->getName()
                   << " already exists.");
     }
-
 }
 
 bool StatContext::del(const std::string& name) {